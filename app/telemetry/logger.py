@@ -1,18 +1,59 @@
+import atexit
+import copy
 import json
 import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+_listener: QueueListener | None = None
+_listener_lock = threading.Lock()
+# Built once: json.dumps constructs a new encoder per call when separators are passed.
+_encoder = json.JSONEncoder(ensure_ascii=True, separators=(",", ":"))
 
 
 class JsonFormatter(logging.Formatter):
     def format(self, rec: logging.LogRecord) -> str:
-        payload = {"level": rec.levelname, "msg": rec.getMessage(), "logger": rec.name}
-        return json.dumps(payload, ensure_ascii=True)
+        payload: dict[str, object] = {
+            "level": rec.levelname,
+            "msg": rec.getMessage(),
+            "logger": rec.name,
+        }
+        # Structured fields arrive as a plain dict via extra={"payload": {...}}.
+        payload.update(getattr(rec, "payload", {}))
+        return _encoder.encode(payload)
+
+
+class _RecordQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The base prepare() runs the default Formatter, which folds tracebacks into msg.
+        # Resolve only the message here so JsonFormatter keeps its payload shape.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        return record
+
+
+def _start_listener() -> QueueListener:
+    # Formatting and stream writes happen on the listener thread, off the caller's path.
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            h = logging.StreamHandler()
+            h.setFormatter(JsonFormatter())
+            _listener = QueueListener(_queue, h)
+            _listener.start()
+            atexit.register(_listener.stop)
+        return _listener
 
 
 def get_logger(name: str = "app") -> logging.Logger:
     lg = logging.getLogger(name)
     if not lg.handlers:
-        h = logging.StreamHandler()
-        h.setFormatter(JsonFormatter())
-        lg.addHandler(h)
+        _start_listener()
+        lg.addHandler(_RecordQueueHandler(_queue))
         lg.setLevel(logging.INFO)
     return lg
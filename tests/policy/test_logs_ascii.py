@@ -2,8 +2,12 @@ import ast
 import pathlib
 import re
 
+import pytest
+
 LOG_CALLS = {"debug", "info", "warning", "error", "exception", "critical"}
 EMOJI = re.compile(r"[\U0001F300-\U0001FAFF]")
+# Raw non-ASCII bytes, or escapes (\x, \u, \U, \N, octal \2xx-\7xx) that can decode to them.
+MAYBE_NON_ASCII = re.compile(rb"[\x80-\xff]|\\[xuUN2-7]")
 
 
 def iter_log_strs(tree):
@@ -18,18 +22,40 @@ def iter_log_strs(tree):
                     yield a.value
 
 
-def test_no_emoji_in_log_literals():
-    for py in pathlib.Path("app").rglob("*.py"):
-        t = ast.parse(py.read_text(encoding="utf-8"))
-        for s in iter_log_strs(t):
-            assert not EMOJI.search(s), f"Emoji in log string: {py}: {s!r}"
+def collect_log_literals(root):
+    # Emoji are non-ASCII too, so files that cannot hold any skip the parse.
+    found = []
+    for py in pathlib.Path(root).rglob("*.py"):
+        data = py.read_bytes()
+        if MAYBE_NON_ASCII.search(data) is None:
+            continue
+        tree = ast.parse(data)
+        found.extend((py, s) for s in iter_log_strs(tree))
+    return found
+
+
+@pytest.fixture(scope="module")
+def log_literals():
+    # Read and parse each file once; both tests share the collected literals.
+    return collect_log_literals("app")
+
+
+def test_no_emoji_in_log_literals(log_literals):
+    for py, s in log_literals:
+        assert not EMOJI.search(s), f"Emoji in log string: {py}: {s!r}"
+
+
+def test_ascii_only_log_literals(log_literals):
+    for py, s in log_literals:
+        assert s.isascii(), f"Non-ASCII log string: {py}: {s!r}"
 
 
-def test_ascii_only_log_literals():
-    for py in pathlib.Path("app").rglob("*.py"):
-        t = ast.parse(py.read_text(encoding="utf-8"))
-        for s in iter_log_strs(t):
-            try:
-                s.encode("ascii")
-            except UnicodeEncodeError as e:
-                raise AssertionError(f"Non-ASCII log string: {py}: {s!r}") from e
+@pytest.mark.filterwarnings("ignore:invalid octal escape sequence")
+def test_prefilter_keeps_escaped_non_ascii(tmp_path):
+    src = 'import logging\nlog = logging.getLogger()\nlog.info("caf\\u00e9")\n'
+    (tmp_path / "u.py").write_text(src, encoding="ascii")
+    (tmp_path / "o.py").write_text(src.replace("caf\\u00e9", "\\477 bad"), encoding="ascii")
+    (tmp_path / "clean.py").write_text(src.replace("caf\\u00e9", "ok"), encoding="ascii")
+    found = {py.name: s for py, s in collect_log_literals(tmp_path)}
+    assert found == {"u.py": "caf\u00e9", "o.py": chr(0o477) + " bad"}
+    assert not any(s.isascii() for s in found.values())
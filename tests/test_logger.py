@@ -1,6 +1,9 @@
+import io
 import json
 import logging
+from logging.handlers import QueueHandler
 
+from app.telemetry import logger as logger_mod
 from app.telemetry.logger import JsonFormatter, get_logger
 
 
@@ -27,4 +30,62 @@ def test_get_logger():
     assert logger.name == "test_app"
     assert logger.level == logging.INFO
     assert len(logger.handlers) == 1
-    assert isinstance(logger.handlers[0].formatter, JsonFormatter)
+    assert isinstance(logger.handlers[0], QueueHandler)
+
+
+def test_listener_emits_json_lines():
+    logger = get_logger("test_listener")
+    listener = logger_mod._start_listener()
+    handler = listener.handlers[0]
+    assert isinstance(handler, logging.StreamHandler)
+    stream = io.StringIO()
+    old = handler.setStream(stream)
+    try:
+        logger.info("job %s created", 7, extra={"payload": {"request_id": "abc123"}})
+        try:
+            raise ZeroDivisionError("division by zero")
+        except ZeroDivisionError:
+            logger.exception("boom")
+        # stop() drains the queue before returning; restart for later tests.
+        listener.stop()
+        listener.start()
+    finally:
+        handler.setStream(old)
+    assert stream.getvalue().splitlines() == [
+        '{"level":"INFO","msg":"job 7 created","logger":"test_listener","request_id":"abc123"}',
+        '{"level":"ERROR","msg":"boom","logger":"test_listener"}',
+    ]
+
+
+def test_json_formatter_payload_fields():
+    formatter = JsonFormatter()
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="test.py",
+        lineno=1,
+        msg="Job created",
+        args=(),
+        exc_info=None,
+    )
+    record.payload = {"request_id": "abc123", "count": 3}
+    data = json.loads(formatter.format(record))
+    assert data["msg"] == "Job created"
+    assert data["request_id"] == "abc123"
+    assert data["count"] == 3
+
+
+def test_json_formatter_escapes_non_ascii():
+    formatter = JsonFormatter()
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="test.py",
+        lineno=1,
+        msg="café",
+        args=(),
+        exc_info=None,
+    )
+    output = formatter.format(record)
+    assert output.isascii()
+    assert json.loads(output)["msg"] == "café"